@@ -1,6 +1,18 @@
 #!/usr/bin/env python3
-import os, sys, json, time, re
+import os, sys, json, time, re, threading, sqlite3
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+try:  # optional C parser; bodies and search pages can be hundreds of KB
+    import orjson
+    _dumps, _loads = orjson.dumps, orjson.loads
+except ImportError:
+    _dumps, _loads = (lambda o: json.dumps(o).encode()), json.loads
+
+_EMPTY = ()  # shared default for absent lists: no per-node allocation
 
 # ---- FIXED BASE URL + SCHEMA ----
 JIRA_SITE = "https://cnhpd.atlassian.net"
@@ -10,168 +22,364 @@ OBJECT_SCHEMA_ID = "3"  # PV Assets
 JIRA_EMAIL          = os.environ.get("JIRA_EMAIL")
 JIRA_API_TOKEN      = os.environ.get("JIRA_API_TOKEN")
 ASSETS_WORKSPACE_ID = os.environ.get("ASSETS_WORKSPACE_ID")
-JQL                 = os.environ.get("JQL") or (
-    'project = PREC AND issuetype = "Mission/Release" AND status != "Validated (Complete)"'
+# Issues we may link; always ANDed onto the JQL (there is no client-side filter)
+REQUIRED_JQL        = 'project = PREC AND issuetype = "Mission/Release" AND status != "Validated (Complete)"'
+JQL                 = (os.environ.get("JQL") or "").strip()
+if JQL:
+    # Keep any ORDER BY outside the parenthesised clause; quoted strings are
+    # matched as whole tokens so "order by" inside a value isn't taken for it
+    cut = next((m.start() for m in re.finditer(
+        r'"(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\'|\border\s+by\b', JQL, re.I)
+        if m.group()[0] not in "\"'"), -1)
+    where, order = (JQL[:cut].strip(), " " + JQL[cut:]) if cut >= 0 else (JQL, "")
+    JQL = f"({where}) AND {REQUIRED_JQL}{order}" if where else REQUIRED_JQL + order
+else:
+    JQL = REQUIRED_JQL
+REQUESTS_PER_SEC    = float(os.environ.get("REQUESTS_PER_SEC") or 10)
+MAX_WORKERS         = 8   # concurrent Assets queries
+ISSUE_WORKERS       = 4   # issues processed concurrently
+ASSETS_CACHE_DB     = os.environ.get("ASSETS_CACHE_DB") or os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "assets_cache.db"
 )
+CACHE_TTL           = 7 * 86400   # object ids are effectively immutable; re-check weekly
 
 if not all([JIRA_EMAIL, JIRA_API_TOKEN, ASSETS_WORKSPACE_ID]):
     print("Missing env(s): JIRA_EMAIL, JIRA_API_TOKEN, ASSETS_WORKSPACE_ID", file=sys.stderr)
     sys.exit(1)
+if not REQUESTS_PER_SEC > 0:
+    print(f"REQUESTS_PER_SEC must be > 0 (got {REQUESTS_PER_SEC})", file=sys.stderr)
+    sys.exit(1)
 
 AUTH = (JIRA_EMAIL, JIRA_API_TOKEN)
-H    = {"Accept":"application/json","Content-Type":"application/json","X-ExperimentalApi": "opt-in",   # <-- important for Assets v1}
+H    = {"Accept":"application/json","Content-Type":"application/json","X-ExperimentalApi": "opt-in"}   # <-- important for Assets v1
+
+# One keep-alive session for every Jira/Assets call (reuses the TLS connection).
+# Requests are only sent from the lookup workers and the search prefetcher
+# (process_issue hands all of its calls to the lookup pool), so that is one
+# pooled connection each; pool_block caps it there if that ever changes.
+POOL_SIZE = MAX_WORKERS + 1
+SESSION = requests.Session()
+SESSION.auth = AUTH
+SESSION.headers.update(H)
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=1, pool_maxsize=POOL_SIZE, pool_block=True,
+    # 429 is left to api(), so every retry goes back through the rate limiter
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(500,502,503,504),
+                      raise_on_status=False),
+))
+
+class RateLimiter:
+    """Token bucket shared by all threads: bursts up to max(rate, 1), only sleeps when empty."""
+    def __init__(self, rate, per=1.0):
+        self.rate, self.per = rate, per
+        self.capacity = max(rate, 1)   # below 1/s the bucket must still fit a whole token
+        self.tokens, self.stamp = self.capacity, time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.stamp) * self.rate / self.per)
+                self.stamp = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) * self.per / self.rate
+            time.sleep(wait)
+
+    def pause(self, delay):
+        """Back every thread off for `delay` seconds (e.g. a 429's Retry-After)."""
+        with self.lock:
+            self.tokens = 0
+            self.stamp = max(self.stamp, time.monotonic() + delay)
+
+LIMITER = RateLimiter(REQUESTS_PER_SEC)
+_ABORT  = threading.Event()   # set by die(): no thread sends anything after a fatal error
+
+def api(method, url, **kw):
+    """
+    Rate-limited request on the shared session; a 429 pauses the shared limiter
+    for Retry-After, so every thread waits it out.
+    A json= body is serialized here with _dumps (Content-Type is on the session).
+    """
+    if "json" in kw:
+        kw["data"] = _dumps(kw.pop("json"))
+    attempts = 5
+    for attempt in range(attempts):
+        if _ABORT.is_set():
+            sys.exit(1)
+        LIMITER.acquire()
+        r = SESSION.request(method, url, **kw)
+        if r.status_code != 429 or attempt == attempts - 1:
+            break
+        try:
+            delay = max(0.0, float(r.headers.get("Retry-After") or 1))
+        except ValueError:  # HTTP-date form
+            delay = 1.0
+        LIMITER.pause(delay)  # the whole process backs off, not just this thread
+    return r
 
 def die(msg, r=None):
     if r is not None:
         print(f"{msg} ({r.status_code}): {r.text}", file=sys.stderr)
     else:
         print(msg, file=sys.stderr)
+    _ABORT.set()
     sys.exit(1)
 
+# ---------- On-disk cache (SQLite), shared by all worker threads ----------
+_CACHE_LOCK = threading.Lock()   # guards the cache connection and _AQL_CACHE
+_cache_conn = None
+
+def cache_db():
+    """Open (first call) and return the cache connection; callers hold _CACHE_LOCK."""
+    global _cache_conn
+    if _cache_conn is None:
+        db = sqlite3.connect(ASSETS_CACHE_DB, check_same_thread=False)
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS obj (schema TEXT, cat TEXT, name TEXT, oid INTEGER, ts INTEGER, "
+            "PRIMARY KEY(schema,cat,name))"
+        )
+        # Normalized remote-link keys per issue, reused when Jira answers 304
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS link_keys (issue TEXT PRIMARY KEY, etag TEXT, keys BLOB, ts INTEGER)"
+        )
+        with db:  # drop issues that haven't been scanned within the TTL
+            db.execute("DELETE FROM link_keys WHERE ts < ?", (int(time.time()) - CACHE_TTL,))
+        _cache_conn = db
+    return _cache_conn
+
 # ---------- Enhanced JQL search with cursor pagination ----------
-def search_get(jql, next_token=None, fields=None, max_results=100):
-    url = f"{JIRA_SITE}/rest/api/3/search/jql"
-    params = {"jql": jql, "maxResults": max_results}
-    if fields:
-        params["fields"] = ",".join(fields)
-    if next_token:
-        params["nextPageToken"] = next_token
-    return requests.get(url, headers=H, auth=AUTH, params=params)
+SEARCH_URL = f"{JIRA_SITE}/rest/api/3/search/jql"
 
-def search_post(jql, next_token=None, fields=None, max_results=100):
-    url = f"{JIRA_SITE}/rest/api/3/search/jql"
-    body = {"jql": jql, "maxResults": max_results}
-    if fields:
-        body["fields"] = fields
+def search_request(method, jql, next_token=None, fields=None, max_results=100):
+    """GET (query params) or POST (JSON body) one page of the enhanced search."""
+    args = {"jql": jql, "maxResults": max_results}
     if next_token:
-        body["nextPageToken"] = next_token
-    return requests.post(url, headers=H, auth=AUTH, json=body)
+        args["nextPageToken"] = next_token
+    if method == "GET":
+        if fields:
+            args["fields"] = ",".join(fields)
+        return api("GET", SEARCH_URL, params=args)
+    if fields:
+        args["fields"] = fields
+    return api("POST", SEARCH_URL, json=args)
+
+def search_page(jql, next_token=None, fields=None):
+    r = search_request("GET", jql, next_token, fields)
+    if r.status_code in (404, 405, 410):
+        r = search_request("POST", jql, next_token, fields)
+    if r.status_code != 200:
+        die("Jira enhanced search failed", r)
+    return _loads(r.content)
 
 def enhanced_search(jql, wanted_fields):
-    next_token = None
-    while True:
-        r = search_get(jql, next_token=next_token, fields=wanted_fields)
-        if r.status_code in (404, 405, 410):
-            r = search_post(jql, next_token=next_token, fields=wanted_fields)
-        if r.status_code != 200:
-            die("Jira enhanced search failed", r)
-        page = r.json()
-        for issue in page.get("issues", []):
-            yield issue
-        next_token = page.get("nextPageToken")
-        if not next_token:
-            break
+    # Prefetch: page N+1 is requested as soon as page N's token arrives,
+    # so its round-trip overlaps with the caller working through page N.
+    with ThreadPoolExecutor(max_workers=1) as prefetch:
+        fut = prefetch.submit(search_page, jql, None, wanted_fields)
+        while fut is not None:
+            page = fut.result()
+            next_token = page.get("nextPageToken")
+            fut = prefetch.submit(search_page, jql, next_token, wanted_fields) if next_token else None
+            for issue in page.get("issues") or _EMPTY:
+                yield issue
 
 # ---------- Issue helpers ----------
-def get_issue_desc(key):
-    url = f"{JIRA_SITE}/rest/api/3/issue/{key}?fields=description"
-    r = requests.get(url, headers=H, auth=AUTH)
-    if r.status_code != 200:
-        die(f"Failed to read description for {key}", r)
-    return r.json().get("fields",{}).get("description") or ""
+def _norm_link(title, url_):
+    """Dedup key for a remote link: trimmed title, lowercase scheme/host, no trailing slash."""
+    u = url_.strip().rstrip("/")
+    parts = urlsplit(u)
+    if parts.netloc:
+        u = parts._replace(scheme=parts.scheme.lower(), netloc=parts.netloc.lower()).geturl()
+    return (title.strip(), u)
+
+def remotelink_url(key):
+    return f"{JIRA_SITE}/rest/api/3/issue/{key}/remotelink"
 
 def list_remote_links(key):
-    url = f"{JIRA_SITE}/rest/api/3/issue/{key}/remotelink"
-    r = requests.get(url, headers=H, auth=AUTH)
-    if r.status_code != 200:
+    """
+    Return a frozenset of _norm_link() keys for the issue's existing remote links.
+    Conditional GET: the keys are stored with the response's ETag and reused on 304.
+    """
+    with _CACHE_LOCK:
+        cached = cache_db().execute(
+            "SELECT etag, keys FROM link_keys WHERE issue=? AND ts>=?",
+            (key, int(time.time()) - CACHE_TTL),
+        ).fetchone()
+    r = api("GET", remotelink_url(key), headers={"If-None-Match": cached[0]} if cached else None)
+    if r.status_code == 304 and cached:
+        etag = cached[0]
+        existing = frozenset(tuple(k) for k in _loads(cached[1]))
+    elif r.status_code == 200:
+        etag = r.headers.get("ETag")
+        links = _loads(r.content)
+        objs = (l.get("object") or {} for l in (links if isinstance(links, list) else _EMPTY))
+        existing = frozenset(
+            _norm_link(o["title"], o["url"]) for o in objs if o.get("title") and o.get("url")
+        )
+    else:
         die(f"Failed to list remote links for {key}", r)
-    links = r.json() if isinstance(r.json(), list) else []
-    existing = set()
-    for l in links:
-        obj = l.get("object",{})
-        title = obj.get("title") or ""
-        url   = obj.get("url") or ""
-        if title and url:
-            existing.add((title.strip(), url.strip()))
+
+    with _CACHE_LOCK, cache_db() as db:
+        if etag:
+            db.execute("INSERT OR REPLACE INTO link_keys VALUES (?,?,?,?)",
+                       (key, etag, _dumps(sorted(existing)), int(time.time())))
+        else:
+            db.execute("DELETE FROM link_keys WHERE issue=?", (key,))
     return existing
 
 def create_remote_link(key, title, url_):
-    url = f"{JIRA_SITE}/rest/api/3/issue/{key}/remotelink"
-    r = requests.post(url, headers=H, auth=AUTH, json={"object":{"title": title, "url": url_}})
+    r = api("POST", remotelink_url(key), json={"object":{"title": title, "url": url_}})
     if r.status_code not in (200,201):
         die(f"Failed to create remote link for {key}", r)
 
 # ---------- Assets lookup (schema 3) ----------
-def aql_lookup(category, name):
+AQL_URL = f"{JIRA_SITE}/jsm/assets/workspace/{ASSETS_WORKSPACE_ID}/v1/object/aql"
+
+def aql_search(category, match, page=1, per_page=2, **extra):
+    """POST one page of `objectType = category AND (match)` in our schema; returns the response dict."""
     aql = (
         f'objectSchemaId = {OBJECT_SCHEMA_ID} '
         f'AND objectType = "{category}" '
-        f'AND (Name = "{name}" OR "Serial Number" = "{name}")'
+        f'AND ({match})'
     )
-    url = f"{JIRA_SITE}/jsm/assets/workspace/{ASSETS_WORKSPACE_ID}/v1/object/aql"
-    r = requests.post(url, headers=H, auth=AUTH, json={"qlQuery": aql, "page":1, "resultPerPage":2})
+    r = api("POST", AQL_URL, json={"qlQuery": aql, "page": page, "resultPerPage": per_page, **extra})
     if r.status_code != 200:
         die("Assets AQL search failed", r)
-    data = r.json() or {}
-    objs = data.get("objectEntries") or []
+    return _loads(r.content) or {}
+
+def aql_lookup(category, name):
+    objs = aql_search(category, f'Name = "{name}" OR "Serial Number" = "{name}"').get("objectEntries")
     return objs[0] if objs else None
 
-def asset_url(object_id:int):
-    return f"{JIRA_SITE}/jira/servicedesk/assets/objects/{object_id}"
+def aql_lookup_batch(category, names):
+    """
+    Look up many names of one category with a single AQL query (paged).
+    Returns {name_or_serial: object}; callers fall back to aql_lookup() on a miss.
+    """
+    quoted = ",".join(f'"{n}"' for n in names)
+    match = f'Name IN ({quoted}) OR "Serial Number" IN ({quoted})'
+    per_page = min(len(names) * 2, 500)
+    found, page = {}, 1
+    while True:
+        data = aql_search(category, match, page, per_page, includeAttributes=True)
+        objs = data.get("objectEntries") or _EMPTY
+        for obj in objs:
+            found.setdefault(obj.get("name") or "", obj)
+            for attr in obj.get("attributes") or _EMPTY:
+                if (attr.get("objectTypeAttribute") or {}).get("name") != "Serial Number":
+                    continue
+                for v in attr.get("objectAttributeValues") or _EMPTY:
+                    found.setdefault(str(v.get("value") or ""), obj)
+        if len(objs) < per_page or page >= (data.get("pageSize") or 1):
+            break
+        page += 1
+    found.pop("", None)
+    return found
+
+# Run-wide (category, name) -> object id, None for a confirmed miss.
+# The same assets recur across Mission/Release issues. Hits also persist
+# in the SQLite cache across runs; misses don't (the asset may be added later).
+_AQL_CACHE = {}
+
+def _db_get(pairs):
+    cutoff = int(time.time()) - CACHE_TTL
+    out = {}
+    for cat, nm in pairs:
+        row = cache_db().execute(
+            "SELECT oid FROM obj WHERE schema=? AND cat=? AND name=? AND ts>=?",
+            (OBJECT_SCHEMA_ID, cat, nm, cutoff),
+        ).fetchone()
+        if row:
+            out[(cat, nm)] = row[0]
+    return out
+
+def _db_put(ids):
+    now = int(time.time())
+    with cache_db() as db:  # one transaction per issue
+        db.executemany(
+            "INSERT OR REPLACE INTO obj VALUES (?,?,?,?,?)",
+            [(OBJECT_SCHEMA_ID, cat, nm, oid, now) for (cat, nm), oid in ids.items()],
+        )
+
+def lookup_object_ids(pool, pairs):
+    """
+    Resolve [(Category, Name), ...] to {(Category, Name): object_id or None}.
+    Pairs in the run cache or the on-disk cache skip the network; the rest
+    go through one batched query per category, with single lookups only
+    for what the batch misses.
+    """
+    with _CACHE_LOCK:
+        ids = {p: _AQL_CACHE[p] for p in pairs if p in _AQL_CACHE}
+        ids.update(_db_get([p for p in pairs if p not in ids]))
+    by_cat = defaultdict(list)
+    for cat, nm in pairs:
+        if (cat, nm) not in ids:
+            by_cat[cat].append(nm)
+
+    fetched = {}
+    found = dict(zip(by_cat, pool.map(lambda c: aql_lookup_batch(c, by_cat[c]), by_cat)))
+    misses = []
+    for cat, names in by_cat.items():
+        for nm in names:
+            obj = found[cat].get(nm)
+            if obj:
+                fetched[(cat, nm)] = obj.get("id")
+            else:
+                misses.append((cat, nm))
+    for p, obj in zip(misses, pool.map(lambda p: aql_lookup(*p), misses)):
+        fetched[p] = obj.get("id") if obj else None
+    ids.update(fetched)
+
+    with _CACHE_LOCK:
+        _AQL_CACHE.update(ids)
+        _db_put({p: oid for p, oid in fetched.items() if oid is not None})
+    return ids
+
+_ASSET_URL_PREFIX = JIRA_SITE + "/jira/servicedesk/assets/objects/"
 
-# ---------- Parse the bullet tree ----------
-bullet_re = re.compile(r"^(?:-|\*)\s+(?P<cat>.+?)\s*$")
-child_re  = re.compile(r"^\s{2,}(?:-|\*)\s+(?P<name>.+?)\s*$")
+def asset_url(object_id:int):
+    return _ASSET_URL_PREFIX + str(object_id)
 
 # ---------- Parse the bullet tree (supports Markdown *and* ADF) ----------
-bullet_re = re.compile(r"^(?:-|\*)\s+(?P<cat>.+?)\s*$")
-child_re  = re.compile(r"^\s{2,}(?:-|\*)\s+(?P<name>.+?)\s*$")
-
-def _adf_text_from_paragraph(node):
-    """Concatenate text content from an ADF paragraph node."""
-    if not node or node.get("type") != "paragraph":
-        return ""
-    out = []
-    for frag in node.get("content", []) or []:
-        if frag.get("type") == "text" and "text" in frag:
-            out.append(frag["text"])
-    return "".join(out).strip()
-
-def _adf_pairs_from_list(list_node):
-    """
-    Given an ADF bulletList node, return [(Category, Name), ...]
-    We treat each top-level listItem's paragraph as a Category,
-    and any nested bulletList items under it as Names.
-    """
-    pairs = []
-    if not list_node or list_node.get("type") != "bulletList":
-        return pairs
-
-    for li in list_node.get("content", []) or []:  # listItem nodes
-        if li.get("type") != "listItem":
-            continue
-        # ListItem usually has: [ paragraph, (optional) bulletList ]
-        children = li.get("content", []) or []
-        if not children:
-            continue
-
-        # First paragraph = category
-        cat = None
-        for ch in children:
-            if ch.get("type") == "paragraph":
-                cat = _adf_text_from_paragraph(ch)
-                break
-        if not cat:
+def _adf_items(nodes, depth=0):
+    """
+    Flatten the bulletLists in `nodes` to (depth, text) per listItem, in
+    document order. Categories (depth 0) take the item's first paragraph,
+    names (depth 1) its first non-empty one; deeper lists aren't visited.
+    """
+    for lst in nodes:
+        if lst.get("type") != "bulletList":
             continue
-
-        # Find nested bulletList(s) for names
-        has_child = False
-        for ch in children:
-            if ch.get("type") == "bulletList":
-                for sub_li in ch.get("content", []) or []:
-                    if sub_li.get("type") != "listItem":
-                        continue
-                    # name = first paragraph text inside the sub listItem
-                    name = ""
-                    for sub_ch in sub_li.get("content", []) or []:
-                        if sub_ch.get("type") == "paragraph":
-                            name = _adf_text_from_paragraph(sub_ch)
-                            if name:
-                                break
-                    if name:
-                        pairs.append((cat, name))
-                        has_child = True
-        # If no nested list, treat the category itself as a single-name row? (not our use case)
+        for li in lst.get("content") or _EMPTY:
+            if li.get("type") != "listItem":
+                continue
+            children = li.get("content") or _EMPTY
+            text = ""
+            for ch in children:
+                if ch.get("type") != "paragraph":
+                    continue
+                text = "".join(f["text"] for f in (ch.get("content") or _EMPTY)
+                               if f.get("type") == "text" and "text" in f).strip()
+                if text or depth == 0:
+                    break
+            yield depth, text
+            if depth == 0:
+                yield from _adf_items(children, 1)
+
+def _adf_pairs(doc):
+    """
+    Return [(Category, Name), ...] from an ADF doc: each top-level
+    bulletList item is a Category, items of lists nested under it are Names.
+    """
+    pairs, cat = [], ""
+    for depth, text in _adf_items(doc.get("content") or _EMPTY):
+        if depth == 0:
+            cat = text
+        elif cat and text:
+            pairs.append((cat, text))
     return pairs
 
 def extract_pairs(desc):
@@ -180,71 +388,109 @@ def extract_pairs(desc):
     Returns list of (Category, Name).
     """
     if isinstance(desc, dict):  # ADF
-        pairs = []
-        for node in (desc.get("content") or []):
-            if node.get("type") == "bulletList":
-                pairs.extend(_adf_pairs_from_list(node))
-        return pairs
+        return _adf_pairs(desc)
 
-    # Fallback: plain text bullets with indentation
+    # Fallback: plain text bullets with indentation.
+    # "- Cat" / "* Cat" at column 0 opens a category; the same bullet
+    # indented by 2+ whitespace chars is a name under it.
     text = desc if isinstance(desc, str) else ""
     pairs, current_cat = [], None
-    for raw in (text or "").splitlines():
-        line = raw.rstrip()
-        m1 = bullet_re.match(line)
-        if m1:
-            current_cat = m1.group("cat").strip()
+    for raw in text.splitlines():
+        s = raw.lstrip()
+        if len(s) < 2 or s[0] not in "-*" or not s[1].isspace():
+            continue
+        item = s[1:].strip()
+        if not item:
             continue
-        m2 = child_re.match(line)
-        if m2 and current_cat:
-            nm = m2.group("name").strip()
-            if nm:
-                pairs.append((current_cat, nm))
+        indent = len(raw) - len(s)
+        if indent == 0:
+            current_cat = item
+        elif indent >= 2 and current_cat:
+            pairs.append((current_cat, item))
     return pairs
 
 # ---------- Main ----------
-def main():
-    wanted_fields = ["summary","description","issuetype","project","status"]
-    total_scanned = 0
-
-    for issue in enhanced_search(JQL, wanted_fields):
-        key    = issue["key"]
-        fields = issue.get("fields") or {}
-        proj   = fields.get("project", {}).get("key")
-        itype  = fields.get("issuetype", {}).get("name")
-        status = fields.get("status", {}).get("name")
+def process_issue(pool, issue):
+    """
+    Link the assets listed in one issue's description.
+    Returns (scanned, log_lines); output is buffered so issues running
+    concurrently don't interleave their lines.
+    """
+    key    = issue["key"]
+    fields = issue.get("fields") or {}
+    log    = []
+
+    # Description comes with the search page (ADF dict or string); no per-issue GET
+    desc = fields.get("description")
+    if desc is None:
+        log.append(f"{key}: no description; skipping")
+        return False, log
+    pairs = list(dict.fromkeys(extract_pairs(desc)))  # drop repeats, keep order
+
+    if not pairs:
+        log.append(f"{key}: no asset tree detected; skipping")
+        return False, log
+
+    # Existing links and Assets lookups are independent: overlap them
+    existing_fut = pool.submit(list_remote_links, key)
+    ids = lookup_object_ids(pool, pairs)
+    existing = set(existing_fut.result())
+
+    to_create = []
+    for cat, nm in pairs:
+        oid = ids[(cat, nm)]
+        if oid is None:
+            log.append(f"{key}: not found in Assets (schema 3) → {cat} / {nm}")
+            continue
+        url_ = asset_url(oid)
+        title = cat + " - " + nm
 
-        # Only PREC + exact type + not Validated (Complete)
-        if proj != "PREC" or itype != "Mission/Release" or status == "Validated (Complete)":
+        link_key = _norm_link(title, url_)
+        if link_key in existing:
+            log.append(f"{key}: link already exists → {title}")
             continue
 
-        desc = fields.get("description") or get_issue_desc(key)  # may be ADF dict or string
-        pairs = extract_pairs(desc)
+        existing.add(link_key)
+        to_create.append((title, url_))
 
-        if not pairs:
-            print(f"{key}: no asset tree detected; skipping")
-            continue
+    # Creates go out together; the shared pool caps how many are in flight
+    for _ in pool.map(lambda t: create_remote_link(key, *t), to_create):
+        pass
+    log.extend(f"{key}: linked {title}" for title, _ in to_create)
 
-        existing = list_remote_links(key)
-        for cat, nm in pairs:
-            obj = aql_lookup(cat, nm)
-            if not obj:
-                print(f"{key}: not found in Assets (schema 3) → {cat} / {nm}")
-                continue
-            oid = obj.get("id")
-            url_ = asset_url(oid)
-            title = f"{cat} - {nm}"
+    return True, log
 
-            if (title, url_) in existing:
-                print(f"{key}: link already exists → {title}")
-                continue
+def _report(future):
+    scanned, log = future.result()
+    for line in log:
+        print(line)
+    return 1 if scanned else 0
 
-            create_remote_link(key, title, url_)
-            existing.add((title, url_))
-            print(f"{key}: linked {title}")
+def main():
+    wanted_fields = ["description"]  # project/type/status filtering is done by the JQL
+    total_scanned = 0
 
-        total_scanned += 1
-        time.sleep(0.2)
+    # Issues overlap on their own pool; their lookups share `pool`.
+    # At most 2*ISSUE_WORKERS issues are in flight, reported in search order.
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool, \
+         ThreadPoolExecutor(max_workers=ISSUE_WORKERS) as issue_pool:
+        pending = deque()
+        try:
+            for issue in enhanced_search(JQL, wanted_fields):
+                pending.append(issue_pool.submit(process_issue, pool, issue))
+                if len(pending) >= 2 * ISSUE_WORKERS:
+                    total_scanned += _report(pending.popleft())
+            while pending:
+                total_scanned += _report(pending.popleft())
+        except SystemExit:
+            # Fatal error somewhere: drop queued issues, let in-flight ones stop
+            # at their next request, and still print what finished cleanly.
+            _ABORT.set()
+            issue_pool.shutdown(cancel_futures=True)
+            for fut in pending:
+                if not fut.cancelled() and fut.exception() is None:
+                    _report(fut)
+            raise
 
     print(f"Done. Issues scanned: {total_scanned}")
 